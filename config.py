@@ -1,5 +1,3 @@
-<<<<<<< HEAD
-=======
 """
 Configuration file for Snake Game with Hand Gesture Control
 
@@ -7,11 +5,10 @@ File: config.py
 Contains all configuration settings for the game
 """
 
->>>>>>> 2f8e980 (Fixes and updates)
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field, replace
 from typing import Tuple
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GameConfig:
 
 
@@ -47,6 +44,7 @@ class GameConfig:
     HAND_TRACKING_CONFIDENCE: float = 0.5
     MAX_NUM_HANDS: int = 1
     GESTURE_SMOOTHING_WINDOW: int = 5
+    INFERENCE_WIDTH: int = 320  # frames wider than this are downscaled for MediaPipe
 
     # Direction Detection
     DIRECTION_THRESHOLD: int = 30  # pixels
@@ -79,11 +77,19 @@ class GameConfig:
         'hard': {'speed': 15, 'speed_increment': 1.0},
     }
 
+    # Derived values, computed once in __post_init__
+    _grid_dims: Tuple[int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # The grid never changes after construction, so compute it once
+        object.__setattr__(self, '_grid_dims', (
+            self.WINDOW_WIDTH // self.GRID_SIZE,
+            self.WINDOW_HEIGHT // self.GRID_SIZE
+        ))
+
     def get_grid_dimensions(self) -> Tuple[int, int]:
         """Get grid dimensions in terms of grid size"""
-        grid_cols = self.WINDOW_WIDTH // self.GRID_SIZE
-        grid_rows = self.WINDOW_HEIGHT // self.GRID_SIZE
-        return grid_cols, grid_rows
+        return self._grid_dims
 
     def get_cell_rect(self, col: int, row: int) -> Tuple[int, int, int, int]:
         """Get pixel coordinates for a grid cell"""
@@ -92,7 +98,7 @@ class GameConfig:
         return (x, y, self.GRID_SIZE - 1, self.GRID_SIZE - 1)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PerformanceConfig:
     """Performance optimization settings"""
 
@@ -101,7 +107,9 @@ class PerformanceConfig:
     WEBCAM_FPS: int = 30
 
     # Hand Detection Optimization
-    SKIP_FRAMES: int = 0  # Process every nth frame (0 = process all)
+    # Frames skipped between hand inferences (0 = process all); the vision
+    # thread is paced to the game FPS, so this counts game ticks
+    SKIP_FRAMES: int = 0
     USE_GPU: bool = True
     REDUCE_HAND_POINTS: bool = False
 
@@ -114,12 +122,16 @@ class PerformanceConfig:
     CLEAR_CACHE_INTERVAL: int = 100
 
 
+# Shared configuration instances. set_difficulty() rebinds GAME_CONFIG, so
+# read it as config.GAME_CONFIG when an object is built, not via from-import
+GAME_CONFIG = GameConfig()
+PERF_CONFIG = PerformanceConfig()
+
+
 class ConfigManager:
     """Manages configuration settings"""
 
     _instance = None
-    _game_config = GameConfig()
-    _performance_config = PerformanceConfig()
 
     def __new__(cls):
         if cls._instance is None:
@@ -129,25 +141,37 @@ class ConfigManager:
     @classmethod
     def get_game_config(cls) -> GameConfig:
         """Get game configuration"""
-        return cls._game_config
+        return GAME_CONFIG
 
     @classmethod
     def get_performance_config(cls) -> PerformanceConfig:
         """Get performance configuration"""
-        return cls._performance_config
+        return PERF_CONFIG
 
     @classmethod
     def set_difficulty(cls, difficulty: str) -> None:
-        """Set difficulty level"""
+        """
+        Set difficulty level
+
+        Configs are frozen, so this rebinds GAME_CONFIG to a new instance;
+        objects that already hold the previous instance keep their old values.
+        """
+        global GAME_CONFIG
         if difficulty in GameConfig.DIFFICULTY_LEVELS:
             settings = GameConfig.DIFFICULTY_LEVELS[difficulty]
-            cls._game_config.FPS = settings['speed']
-            cls._game_config.SPEED_INCREMENT = settings['speed_increment']
+            GAME_CONFIG = replace(
+                GAME_CONFIG,
+                FPS=settings['speed'],
+                SPEED_INCREMENT=settings['speed_increment']
+            )
 
     @classmethod
     def to_dict(cls) -> dict:
         """Convert configuration to dictionary"""
+        # Skip private derived fields such as GameConfig._grid_dims
         return {
-            'game': cls._game_config.__dict__,
-            'performance': cls._performance_config.__dict__,
+            'game': {
+                k: v for k, v in asdict(GAME_CONFIG).items() if not k.startswith('_')
+            },
+            'performance': asdict(PERF_CONFIG),
         }
@@ -1,17 +1,26 @@
+import numpy as np
 import pygame
 import random
-from collections import deque
-from enum import Enum
-from typing import Tuple
+from enum import Enum, IntEnum
+from functools import cached_property
+from pathlib import Path
+from typing import List, Optional, Tuple
 
-from config import ConfigManager
+import config
 
-class Direction(Enum):
+HIGH_SCORE_FILE = 'high_score.txt'
+
+class Direction(IntEnum):
     """Snake movement directions"""
-    UP = (0, -1)
-    DOWN = (0, 1)
-    LEFT = (-1, 0)
-    RIGHT = (1, 0)
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+
+# Per-direction grid step and reverse direction, indexed by Direction
+DX = (0, 0, -1, 1)
+DY = (-1, 1, 0, 0)
+OPP = (Direction.DOWN, Direction.UP, Direction.RIGHT, Direction.LEFT)
 
 class GameState(Enum):
     """Game state enumeration"""
@@ -20,6 +29,9 @@ class GameState(Enum):
     PAUSED = 2
     GAME_OVER = 3
 
+# Bound once so per-frame state checks are a plain identity test
+PLAYING = GameState.PLAYING
+
 class SnakeGame:
     """Main game logic controller"""
 
@@ -27,7 +39,8 @@ class SnakeGame:
         """Initialize the game"""
         pygame.init()
 
-        self.config = ConfigManager.get_game_config()
+        # Read at construction time so set_difficulty() changes take effect
+        self.config = config.GAME_CONFIG
 
         self.screen = pygame.display.set_mode(
             (self.config.WINDOW_WIDTH, self.config.WINDOW_HEIGHT)
@@ -35,9 +48,12 @@ class SnakeGame:
         pygame.display.set_caption(self.config.WINDOW_TITLE)
 
         self.clock = pygame.time.Clock()
-        self.font_large = pygame.font.Font(None, self.config.FONT_SIZE_LARGE)
-        self.font_medium = pygame.font.Font(None, self.config.FONT_SIZE_MEDIUM)
-        self.font_small = pygame.font.Font(None, self.config.FONT_SIZE_SMALL)
+
+        # Static surface rendered once and blitted every frame
+        self._grid_surface = self._build_grid_surface()
+
+        # Rendered "label: value" text, keyed by (font, label, value, color)
+        self._text_cache = {}
 
         # Game state
         self.state = GameState.MENU
@@ -46,14 +62,58 @@ class SnakeGame:
         self.frame_count = 0
         self.speed_multiplier = 1.0
 
-        # Snake and food
-        self.snake = None
+        # Snake and food: the body is a ring buffer of cells, head first,
+        # plus a (rows, cols) occupancy grid for O(1) collision tests
+        self._snake_xy = None
+        self._head = 0
+        self._len = 0
+        self._occupancy = None
         self.direction = Direction.RIGHT
         self.next_direction = Direction.RIGHT
         self.food = None
 
         self.reset_game()
 
+    # Fonts and text built from them are created on first use
+    @cached_property
+    def font_large(self) -> pygame.font.Font:
+        return pygame.font.Font(None, self.config.FONT_SIZE_LARGE)
+
+    @cached_property
+    def font_medium(self) -> pygame.font.Font:
+        return pygame.font.Font(None, self.config.FONT_SIZE_MEDIUM)
+
+    @cached_property
+    def font_small(self) -> pygame.font.Font:
+        return pygame.font.Font(None, self.config.FONT_SIZE_SMALL)
+
+    @cached_property
+    def _menu_cache(self) -> dict:
+        return self._build_menu_cache()
+
+    @property
+    def snake(self) -> List[Tuple[int, int]]:
+        """Snake cells from head to tail (a copy; not for per-frame use)"""
+        return [tuple(cell) for cell in self._body().tolist()]
+
+    def _body(self) -> np.ndarray:
+        """Snake cells from head to tail as an (N, 2) array"""
+        idx = (self._head + np.arange(self._len)) % len(self._snake_xy)
+        return self._snake_xy[idx]
+
+    def _push_head(self, x: int, y: int):
+        """Add a cell at the head of the snake"""
+        self._head = (self._head - 1) % len(self._snake_xy)
+        self._snake_xy[self._head] = (x, y)
+        self._len += 1
+        self._occupancy[y, x] = 1
+
+    def _pop_tail(self):
+        """Remove the last cell of the snake"""
+        self._len -= 1
+        x, y = self._snake_xy[(self._head + self._len) % len(self._snake_xy)]
+        self._occupancy[y, x] = 0
+
     def reset_game(self):
         """Reset game to initial state"""
         # Initialize snake in center
@@ -61,11 +121,15 @@ class SnakeGame:
         start_x = grid_cols // 2
         start_y = grid_rows // 2
 
-        self.snake = deque([
-            (start_x, start_y),
-            (start_x - 1, start_y),
-            (start_x - 2, start_y)
-        ])
+        # The snake can never be longer than the board
+        self._snake_xy = np.zeros((grid_cols * grid_rows, 2), dtype=np.int16)
+        self._head = 0
+        self._len = 0
+        self._occupancy = np.zeros((grid_rows, grid_cols), dtype=np.uint8)
+
+        # Push tail first so the head ends up at the front
+        for offset in (2, 1, 0):
+            self._push_head(start_x - offset, start_y)
 
         self.direction = Direction.RIGHT
         self.next_direction = Direction.RIGHT
@@ -74,34 +138,46 @@ class SnakeGame:
         self.frame_count = 0
         self.speed_multiplier = 1.0
         self.state = GameState.MENU
+        self._text_cache = {}
 
     def start_game(self):
         """Start the game from menu"""
-        if self.state == GameState.MENU:
+        if self.state is GameState.MENU:
             self.state = GameState.PLAYING
 
     def toggle_pause(self):
         """Toggle pause state"""
-        if self.state == GameState.PLAYING:
+        if self.state is GameState.PLAYING:
             self.state = GameState.PAUSED
-        elif self.state == GameState.PAUSED:
+        elif self.state is GameState.PAUSED:
             self.state = GameState.PLAYING
 
-    def _spawn_food(self) -> Tuple[int, int]:
+    def _spawn_food(self) -> Optional[Tuple[int, int]]:
         """
         Spawn food at random location not occupied by snake
 
         Returns:
-            Tuple of (x, y) grid coordinates
+            Tuple of (x, y) grid coordinates, or None if the board is full
         """
         grid_cols, grid_rows = self.config.get_grid_dimensions()
+        occupancy = self._occupancy
 
-        while True:
-            x = random.randint(0, grid_cols - 1)
-            y = random.randint(0, grid_rows - 1)
+        # Rejection sampling is fast while most of the board is free
+        if self._len * 2 < grid_cols * grid_rows:
+            while True:
+                x = random.randint(0, grid_cols - 1)
+                y = random.randint(0, grid_rows - 1)
 
-            if (x, y) not in self.snake:
-                return (x, y)
+                if not occupancy[y, x]:
+                    return (x, y)
+
+        # Crowded board: pick directly from the free cells
+        free_cells = np.flatnonzero(occupancy == 0)
+        if free_cells.size == 0:
+            return None
+
+        y, x = divmod(int(random.choice(free_cells)), grid_cols)
+        return (x, y)
 
     def update_direction(self, hand_pos: Tuple[int, int]):
         """
@@ -110,13 +186,13 @@ class SnakeGame:
         Args:
             hand_pos: Current hand position in pixels
         """
-        if hand_pos is None or len(self.snake) == 0:
+        if hand_pos is None or self._len == 0:
             return
 
-        if self.state != GameState.PLAYING:
+        if self.state is not PLAYING:
             return
 
-        head = self.snake[0]
+        head = self._snake_xy[self._head].tolist()
         head_screen = (
             head[0] * self.config.GRID_SIZE + self.config.GRID_SIZE // 2,
             head[1] * self.config.GRID_SIZE + self.config.GRID_SIZE // 2
@@ -136,51 +212,55 @@ class SnakeGame:
 
     def update(self):
         """Update game logic"""
-        if self.state != GameState.PLAYING:
+        if self.state is not PLAYING:
             return
 
         self.frame_count += 1
 
         # Prevent 180-degree turns
-        if (self.next_direction.value[0] * -1, self.next_direction.value[1] * -1) != \
-           self.direction.value:
-            self.direction = self.next_direction
+        d = self.next_direction
+        if OPP[d] != self.direction:
+            self.direction = d
+        d = self.direction
 
         # Move snake
-        head = self.snake[0]
-        new_head = (
-            head[0] + self.direction.value[0],
-            head[1] + self.direction.value[1]
-        )
+        head_x, head_y = self._snake_xy[self._head].tolist()
+        new_x = head_x + DX[d]
+        new_y = head_y + DY[d]
+        new_head = (new_x, new_y)
 
         grid_cols, grid_rows = self.config.get_grid_dimensions()
 
         # Check wall collision
-        if new_head[0] < 0 or new_head[0] >= grid_cols or \
-           new_head[1] < 0 or new_head[1] >= grid_rows:
+        if not (0 <= new_x < grid_cols and 0 <= new_y < grid_rows):
             self.state = GameState.GAME_OVER
             self._update_high_score()
             return
 
         # Check self collision
-        if new_head in self.snake:
+        if self._occupancy[new_y, new_x]:
             self.state = GameState.GAME_OVER
             self._update_high_score()
             return
 
-        self.snake.appendleft(new_head)
+        self._push_head(new_x, new_y)
 
         # Check food collision
         if new_head == self.food:
             self.score += self.config.FOOD_POINTS
             self.food = self._spawn_food()
             self._increase_speed()
+
+            # Snake fills the whole board: nothing left to eat, game is won
+            if self.food is None:
+                self.state = GameState.GAME_OVER
+                self._update_high_score()
         else:
-            self.snake.pop()
+            self._pop_tail()
 
     def _increase_speed(self):
         """Increase game speed based on score"""
-        snake_length = len(self.snake)
+        snake_length = self._len
         self.speed_multiplier = 1.0 + (snake_length * 0.05)
 
     def draw(self):
@@ -192,188 +272,182 @@ class SnakeGame:
             self._draw_grid()
 
         # Draw game elements
-        if self.state != GameState.MENU:
+        if self.state is not GameState.MENU:
             self._draw_snake()
-            self._draw_food()
+            if self.food is not None:
+                self._draw_food()
 
         # Draw UI
         self._draw_ui()
 
         pygame.display.flip()
 
+    def _build_grid_lines(self) -> list:
+        """Compute (start, end) points of every vertical and horizontal grid line"""
+        gs = self.config.GRID_SIZE
+        width = self.config.WINDOW_WIDTH
+        height = self.config.WINDOW_HEIGHT
+
+        vertical = [((x, 0), (x, height)) for x in range(0, width, gs)]
+        horizontal = [((0, y), (width, y)) for y in range(0, height, gs)]
+        return vertical + horizontal
+
+    def _build_grid_surface(self) -> pygame.Surface:
+        """Render the static grid lines once onto a transparent surface"""
+        surface = pygame.Surface(
+            (self.config.WINDOW_WIDTH, self.config.WINDOW_HEIGHT), pygame.SRCALPHA
+        )
+        color = self.config.COLOR_GRID
+        line = pygame.draw.line
+
+        for start, end in self._build_grid_lines():
+            line(surface, color, start, end)
+
+        return surface.convert_alpha()
+
+    def _build_menu_cache(self) -> dict:
+        """Render the overlay and text that never change between frames"""
+        color = self.config.COLOR_TEXT
+
+        overlay = pygame.Surface((self.config.WINDOW_WIDTH, self.config.WINDOW_HEIGHT))
+        overlay.set_alpha(128)
+        overlay.fill((0, 0, 0))
+
+        return {
+            'overlay': overlay,
+            'title': self.font_large.render("SNAKE GAME", True, color),
+            'subtitle': self.font_medium.render("Hand Gesture Control", True, color),
+            'start': self.font_medium.render("Press SPACE to Start", True, color),
+            'paused': self.font_large.render("PAUSED", True, color),
+            'resume': self.font_medium.render("Make a fist to resume", True, color),
+            'game_over': self.font_large.render(
+                "GAME OVER", True, self.config.COLOR_DANGER
+            ),
+            'restart': self.font_medium.render("Press SPACE to Restart", True, color),
+        }
+
+    def _text(self, font_id: str, label: str, value: int, color) -> pygame.Surface:
+        """
+        Render "label: value" text, reusing the surface while value is unchanged
+
+        Args:
+            font_id: Font attribute name, e.g. 'font_medium'
+            label: Text shown before the value
+            value: Number to display
+            color: Text color
+
+        Returns:
+            Rendered text surface
+        """
+        key = (font_id, label, value, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            font = getattr(self, font_id)
+            surface = font.render(f"{label}: {value}", True, color)
+            self._text_cache[key] = surface
+        return surface
+
     def _draw_grid(self):
         """Draw game grid"""
-        for x in range(0, self.config.WINDOW_WIDTH, self.config.GRID_SIZE):
-            pygame.draw.line(
-                self.screen,
-                self.config.COLOR_GRID,
-                (x, 0),
-                (x, self.config.WINDOW_HEIGHT)
-            )
-
-        for y in range(0, self.config.WINDOW_HEIGHT, self.config.GRID_SIZE):
-            pygame.draw.line(
-                self.screen,
-                self.config.COLOR_GRID,
-                (0, y),
-                (self.config.WINDOW_WIDTH, y)
-            )
+        self.screen.blit(self._grid_surface, (0, 0))
 
     def _draw_snake(self):
         """Draw snake on screen"""
-        for i, segment in enumerate(self.snake):
-            x = segment[0] * self.config.GRID_SIZE
-            y = segment[1] * self.config.GRID_SIZE
-
+        gs = self.config.GRID_SIZE
+        size = gs - 2
+        head_color = self.config.COLOR_HEAD
+        body_color = self.config.COLOR_SNAKE
+        screen = self.screen
+        Rect = pygame.Rect
+        draw_rect = pygame.draw.rect
+
+        # Pixel corners of every segment, head first
+        corners = (self._body() * gs + 1).tolist()
+
+        for i, (x, y) in enumerate(corners):
             # Head is brighter
-            color = self.config.COLOR_HEAD if i == 0 else self.config.COLOR_SNAKE
-
-            rect = pygame.Rect(
-                x + 1,
-                y + 1,
-                self.config.GRID_SIZE - 2,
-                self.config.GRID_SIZE - 2
-            )
-            pygame.draw.rect(self.screen, color, rect)
+            color = head_color if i == 0 else body_color
+            draw_rect(screen, color, Rect(x, y, size, size))
 
     def _draw_food(self):
         """Draw food on screen"""
-        x = self.food[0] * self.config.GRID_SIZE
-        y = self.food[1] * self.config.GRID_SIZE
-
-        rect = pygame.Rect(
-            x + 1,
-            y + 1,
-            self.config.GRID_SIZE - 2,
-            self.config.GRID_SIZE - 2
-        )
+        gs = self.config.GRID_SIZE
+        col, row = self.food
+
+        rect = pygame.Rect(col * gs + 1, row * gs + 1, gs - 2, gs - 2)
         pygame.draw.rect(self.screen, self.config.COLOR_FOOD, rect)
 
     def _draw_ui(self):
         """Draw UI elements"""
         # Draw score
-        score_text = self.font_medium.render(
-            f"Score: {self.score}",
-            True,
-            self.config.COLOR_TEXT
-        )
+        color = self.config.COLOR_TEXT
+        score_text = self._text('font_medium', "Score", self.score, color)
         self.screen.blit(score_text, (10, 10))
 
         # Draw high score
-        high_score_text = self.font_small.render(
-            f"Best: {self.high_score}",
-            True,
-            self.config.COLOR_TEXT
-        )
+        high_score_text = self._text('font_small', "Best", self.high_score, color)
         self.screen.blit(high_score_text, (10, 50))
 
         # Draw snake length
-        length_text = self.font_small.render(
-            f"Length: {len(self.snake)}",
-            True,
-            self.config.COLOR_TEXT
-        )
+        length_text = self._text('font_small', "Length", self._len, color)
         self.screen.blit(length_text, (self.config.WINDOW_WIDTH - 200, 10))
 
         # Draw state-specific UI
-        if self.state == GameState.MENU:
+        if self.state is GameState.MENU:
             self._draw_menu()
-        elif self.state == GameState.PAUSED:
+        elif self.state is GameState.PAUSED:
             self._draw_paused()
-        elif self.state == GameState.GAME_OVER:
+        elif self.state is GameState.GAME_OVER:
             self._draw_game_over()
 
     def _draw_menu(self):
         """Draw menu screen"""
-        title = self.font_large.render(
-            "SNAKE GAME",
-            True,
-            self.config.COLOR_TEXT
-        )
-        subtitle = self.font_medium.render(
-            "Hand Gesture Control",
-            True,
-            self.config.COLOR_TEXT
-        )
-        start_text = self.font_medium.render(
-            "Press SPACE to Start",
-            True,
-            self.config.COLOR_TEXT
-        )
+        cache = self._menu_cache
 
         center_x = self.config.WINDOW_WIDTH // 2
         center_y = self.config.WINDOW_HEIGHT // 2
 
-        self.screen.blit(title, (center_x - 200, center_y - 100))
-        self.screen.blit(subtitle, (center_x - 180, center_y - 20))
-        self.screen.blit(start_text, (center_x - 180, center_y + 60))
+        self.screen.blit(cache['title'], (center_x - 200, center_y - 100))
+        self.screen.blit(cache['subtitle'], (center_x - 180, center_y - 20))
+        self.screen.blit(cache['start'], (center_x - 180, center_y + 60))
 
     def _draw_paused(self):
         """Draw paused overlay"""
-        overlay = pygame.Surface((self.config.WINDOW_WIDTH, self.config.WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-
-        pause_text = self.font_large.render(
-            "PAUSED",
-            True,
-            self.config.COLOR_TEXT
-        )
-        resume_text = self.font_medium.render(
-            "Make a fist to resume",
-            True,
-            self.config.COLOR_TEXT
-        )
+        cache = self._menu_cache
+        self.screen.blit(cache['overlay'], (0, 0))
 
         center_x = self.config.WINDOW_WIDTH // 2
         center_y = self.config.WINDOW_HEIGHT // 2
 
-        self.screen.blit(pause_text, (center_x - 120, center_y - 40))
-        self.screen.blit(resume_text, (center_x - 160, center_y + 40))
+        self.screen.blit(cache['paused'], (center_x - 120, center_y - 40))
+        self.screen.blit(cache['resume'], (center_x - 160, center_y + 40))
 
     def _draw_game_over(self):
         """Draw game over screen"""
-        overlay = pygame.Surface((self.config.WINDOW_WIDTH, self.config.WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        cache = self._menu_cache
+        self.screen.blit(cache['overlay'], (0, 0))
 
-        over_text = self.font_large.render(
-            "GAME OVER",
-            True,
-            self.config.COLOR_DANGER
-        )
-        score_text = self.font_medium.render(
-            f"Score: {self.score}",
-            True,
-            self.config.COLOR_TEXT
-        )
-        best_text = self.font_medium.render(
-            f"Best: {self.high_score}",
-            True,
-            self.config.COLOR_TEXT
-        )
-        restart_text = self.font_medium.render(
-            "Press SPACE to Restart",
-            True,
-            self.config.COLOR_TEXT
-        )
+        color = self.config.COLOR_TEXT
+        score_text = self._text('font_medium', "Score", self.score, color)
+        best_text = self._text('font_medium', "Best", self.high_score, color)
 
         center_x = self.config.WINDOW_WIDTH // 2
         center_y = self.config.WINDOW_HEIGHT // 2
 
-        self.screen.blit(over_text, (center_x - 180, center_y - 80))
+        self.screen.blit(cache['game_over'], (center_x - 180, center_y - 80))
         self.screen.blit(score_text, (center_x - 100, center_y - 20))
         self.screen.blit(best_text, (center_x - 80, center_y + 20))
-        self.screen.blit(restart_text, (center_x - 180, center_y + 80))
+        self.screen.blit(cache['restart'], (center_x - 180, center_y + 80))
 
     def _load_high_score(self) -> int:
         """Load high score from file"""
+        path = Path(HIGH_SCORE_FILE)
+        if not path.is_file():
+            return 0
+
         try:
-            with open('high_score.txt', 'r') as f:
-                return int(f.read())
-        except:
+            return int(path.read_text())
+        except (ValueError, OSError):
             return 0
 
     def _update_high_score(self):
@@ -381,9 +455,9 @@ class SnakeGame:
         if self.score > self.high_score:
             self.high_score = self.score
             try:
-                with open('high_score.txt', 'w') as f:
+                with open(HIGH_SCORE_FILE, 'w') as f:
                     f.write(str(self.high_score))
-            except:
+            except OSError:
                 pass
 
     def cleanup(self):
@@ -1,5 +1,3 @@
-<<<<<<< HEAD
-=======
 """
 Hand tracking module using MediaPipe
 
@@ -7,15 +5,11 @@ File: hand_tracker.py
 Handles real-time hand detection and gesture recognition
 """
 
->>>>>>> 2f8e980 (Fixes and updates)
 import cv2
-import mediapipe as mp
 import numpy as np
-from collections import deque
 from typing import Tuple, Optional
-import math
 
-from config import ConfigManager
+import config
 
 class HandTracker:
     """Real-time hand tracking and gesture detection"""
@@ -30,10 +24,15 @@ class HandTracker:
     INDEX_PIP = 6
     MIDDLE_PIP = 10
     PALM_CENTER = 9
+    FINGER_TIPS = [THUMB_TIP, INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP]
+    NUM_LANDMARKS = 21
 
     def __init__(self):
         """Initialize hand tracker"""
-        self.config = ConfigManager.get_game_config()
+        # MediaPipe is slow to import, so load it only when a tracker is built
+        import mediapipe as mp
+
+        self.config = config.GAME_CONFIG
 
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
@@ -46,16 +45,91 @@ class HandTracker:
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
 
-        # Position smoothing
-        self.position_history = deque(
-            maxlen=self.config.GESTURE_SMOOTHING_WINDOW
-        )
+        # Position smoothing: fixed-size ring buffer with running sums
+        self._window = self.config.GESTURE_SMOOTHING_WINDOW
+        self._pos_ring = np.zeros((self._window, 2), dtype=np.int32)
+        self._ring_idx = 0
+        self._ring_fill = 0
+        self._sum_x = 0
+        self._sum_y = 0
 
         # Hand state tracking
         self.is_hand_detected = False
         self.last_valid_position = None
         self.frame_count = 0
 
+        # Cached inference output shared by all detectors for the current frame
+        self._last_results = None
+        self._last_frame = None
+        self._last_pts = None
+
+        # Reused per-frame buffers for the downscaled and RGB images
+        self._small_buf = None
+        self._rgb_buf = None
+
+    def process(self, frame: np.ndarray):
+        """
+        Run MediaPipe hand inference once for the current frame
+
+        The results are cached so the detection and drawing helpers
+        reuse them instead of running inference again. Landmarks are
+        normalized, so the frame is downscaled before inference and the
+        helpers still map them onto the full-size frame.
+
+        Args:
+            frame: Input video frame (BGR)
+
+        Returns:
+            MediaPipe hand results for the frame
+        """
+        h, w = frame.shape[:2]
+        max_w = self.config.INFERENCE_WIDTH
+        if w > max_w:
+            small_shape = (round(h * max_w / w), max_w, 3)
+            if self._small_buf is None or self._small_buf.shape != small_shape:
+                self._small_buf = np.empty(small_shape, dtype=np.uint8)
+            cv2.resize(frame, (max_w, small_shape[0]), dst=self._small_buf,
+                       interpolation=cv2.INTER_AREA)
+            frame_small = self._small_buf
+        else:
+            frame_small = frame
+
+        if self._rgb_buf is None or self._rgb_buf.shape != frame_small.shape:
+            self._rgb_buf = np.empty_like(frame_small)
+        cv2.cvtColor(frame_small, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        self._last_results = self.hands.process(self._rgb_buf)
+        self._last_frame = frame
+        self.frame_count += 1
+
+        # Copy the first hand's landmarks into an (N, 3) array once per frame
+        if self._last_results.multi_hand_landmarks:
+            landmarks = self._last_results.multi_hand_landmarks[0]
+            self._last_pts = self._landmarks_to_np(landmarks)
+        else:
+            self._last_pts = None
+
+        return self._last_results
+
+    @classmethod
+    def _landmarks_to_np(cls, landmarks) -> np.ndarray:
+        """
+        Copy a MediaPipe landmark list into an (N, 3) float32 array
+
+        Gesture checks then index the array instead of going through
+        protobuf attribute access for every coordinate.
+        """
+        return np.fromiter(
+            (c for lm in landmarks.landmark for c in (lm.x, lm.y, lm.z)),
+            dtype=np.float32,
+            count=cls.NUM_LANDMARKS * 3
+        ).reshape(cls.NUM_LANDMARKS, 3)
+
+    def _get_results(self, frame: np.ndarray):
+        """Return cached results for frame, running inference if it is a new frame"""
+        if frame is not self._last_frame:
+            return self.process(frame)
+        return self._last_results
+
     def detect_hand(self, frame: np.ndarray) -> Tuple[Optional[Tuple[int, int]], bool]:
         """
         Detect hand and return index finger position
@@ -67,23 +141,20 @@ class HandTracker:
             Tuple of (hand_position, is_detected)
         """
         h, w, c = frame.shape
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
+        results = self._get_results(frame)
 
         if results.multi_hand_landmarks:
-            landmarks = results.multi_hand_landmarks[0]
-
             # Get index finger tip (landmark 8)
-            index_tip = landmarks.landmark[self.INDEX_TIP]
-            x = int(index_tip.x * w)
-            y = int(index_tip.y * h)
+            index_tip = self._last_pts[self.INDEX_TIP]
+            x = int(float(index_tip[0]) * w)
+            y = int(float(index_tip[1]) * h)
 
             # Clamp coordinates to frame bounds
             x = max(0, min(x, w - 1))
             y = max(0, min(y, h - 1))
 
             position = (x, y)
-            self.position_history.append(position)
+            self._push_position(x, y)
             self.last_valid_position = position
             self.is_hand_detected = True
 
@@ -103,49 +174,19 @@ class HandTracker:
             True if fist is detected
         """
         h, w, c = frame.shape
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
+        results = self._get_results(frame)
 
         if not results.multi_hand_landmarks:
             return False
 
-        landmarks = results.multi_hand_landmarks[0]
-
-        try:
-            # Get relevant points
-            thumb_tip = landmarks.landmark[self.THUMB_TIP]
-            index_tip = landmarks.landmark[self.INDEX_TIP]
-            middle_tip = landmarks.landmark[self.MIDDLE_TIP]
-            ring_tip = landmarks.landmark[self.RING_TIP]
-            pinky_tip = landmarks.landmark[self.PINKY_TIP]
-            wrist = landmarks.landmark[self.WRIST]
-            palm = landmarks.landmark[self.PALM_CENTER]
-
-            # Calculate distances from palm center to finger tips
-            def distance_3d(p1, p2):
-                return math.sqrt(
-                    (p1.x - p2.x)**2 +
-                    (p1.y - p2.y)**2 +
-                    (p1.z - p2.z)**2
-                )
-
-            # Check if all fingers are close to palm (fist)
-            thumb_dist = distance_3d(thumb_tip, palm)
-            index_dist = distance_3d(index_tip, palm)
-            middle_dist = distance_3d(middle_tip, palm)
-            ring_dist = distance_3d(ring_tip, palm)
-            pinky_dist = distance_3d(pinky_tip, palm)
+        pts = self._last_pts
 
-            avg_finger_dist = (
-                thumb_dist + index_dist + middle_dist + ring_dist + pinky_dist
-            ) / 5
+        # Distances from palm center to all five finger tips in one pass
+        tips = pts[self.FINGER_TIPS]
+        finger_dists = np.sqrt(((tips - pts[self.PALM_CENTER]) ** 2).sum(axis=1))
 
-            # Fist detected if average finger distance is below threshold
-            return avg_finger_dist < self.config.FIST_CLOSED_THRESHOLD
-
-        except Exception as e:
-            print(f"Error in fist detection: {e}")
-            return False
+        # Fist detected if average finger distance is below threshold
+        return bool(finger_dists.mean() < self.config.FIST_CLOSED_THRESHOLD)
 
     def detect_palm_open(self, frame: np.ndarray) -> bool:
         """
@@ -158,29 +199,18 @@ class HandTracker:
             True if palm is open
         """
         h, w, c = frame.shape
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
+        results = self._get_results(frame)
 
         if not results.multi_hand_landmarks:
             return False
 
-        landmarks = results.multi_hand_landmarks[0]
-
-        try:
-            # Get distances between finger tips
-            index_tip = landmarks.landmark[self.INDEX_TIP]
-            middle_tip = landmarks.landmark[self.MIDDLE_TIP]
+        pts = self._last_pts
 
-            def distance_2d(p1, p2):
-                return math.sqrt((p1.x - p2.x)**2 + (p1.y - p2.y)**2)
+        # Open palm has fingers spread apart (compare squared 2D distance)
+        spread = pts[self.INDEX_TIP, :2] - pts[self.MIDDLE_TIP, :2]
+        threshold = self.config.PALM_SIZE_THRESHOLD
 
-            # Open palm has fingers spread apart
-            finger_spread = distance_2d(index_tip, middle_tip)
-
-            return finger_spread > self.config.PALM_SIZE_THRESHOLD
-
-        except:
-            return False
+        return bool((spread ** 2).sum() > threshold * threshold)
 
     def get_smoothed_position(self) -> Optional[Tuple[int, int]]:
         """
@@ -189,24 +219,35 @@ class HandTracker:
         Returns:
             Smoothed position or None if not available
         """
-        if not self.position_history:
+        n = self._ring_fill
+        if n == 0:
             return None
 
-        positions = list(self.position_history)
-        if not positions:
-            return None
+        return (self._sum_x // n, self._sum_y // n)
 
-        avg_x = sum(p[0] for p in positions) / len(positions)
-        avg_y = sum(p[1] for p in positions) / len(positions)
+    def _push_position(self, x: int, y: int) -> None:
+        """Add a position to the smoothing window, evicting the oldest"""
+        slot = self._pos_ring[self._ring_idx]
+        if self._ring_fill == self._window:
+            self._sum_x -= int(slot[0])
+            self._sum_y -= int(slot[1])
+        else:
+            self._ring_fill += 1
 
-        return (int(avg_x), int(avg_y))
+        slot[0] = x
+        slot[1] = y
+        self._sum_x += x
+        self._sum_y += y
+        self._ring_idx = (self._ring_idx + 1) % self._window
 
-    def draw_hand_landmarks(self, frame: np.ndarray) -> np.ndarray:
+    def draw_hand_landmarks(self, frame: np.ndarray, results=None) -> np.ndarray:
         """
         Draw hand landmarks on frame
 
         Args:
             frame: Input video frame
+            results: Results to draw instead of this frame's own, e.g. the
+                last processed frame's results when inference is skipped
 
         Returns:
             Frame with hand landmarks drawn
@@ -214,9 +255,8 @@ class HandTracker:
         if not self.config.SHOW_HAND_LANDMARKS:
             return frame
 
-        h, w, c = frame.shape
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
+        if results is None:
+            results = self._get_results(frame)
 
         if results.multi_hand_landmarks:
             for hand_landmarks in results.multi_hand_landmarks:
@@ -241,32 +281,33 @@ class HandTracker:
             Tuple of (x_min, y_min, x_max, y_max) or None
         """
         h, w, c = frame.shape
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
+        results = self._get_results(frame)
 
         if not results.multi_hand_landmarks:
             return None
 
-        landmarks = results.multi_hand_landmarks[0]
-
-        x_coords = [lm.x * w for lm in landmarks.landmark]
-        y_coords = [lm.y * h for lm in landmarks.landmark]
+        xy = self._last_pts[:, :2]
+        x_min, y_min = xy.min(axis=0).tolist()
+        x_max, y_max = xy.max(axis=0).tolist()
 
         return (
-            int(min(x_coords)),
-            int(min(y_coords)),
-            int(max(x_coords)),
-            int(max(y_coords))
+            int(x_min * w),
+            int(y_min * h),
+            int(x_max * w),
+            int(y_max * h)
         )
 
     def reset_history(self) -> None:
         """Reset position history"""
-        self.position_history.clear()
+        self._ring_idx = 0
+        self._ring_fill = 0
+        self._sum_x = 0
+        self._sum_y = 0
 
     def get_stats(self) -> dict:
         """Get tracker statistics"""
         return {
             'hand_detected': self.is_hand_detected,
-            'history_size': len(self.position_history),
+            'history_size': self._ring_fill,
             'last_position': self.last_valid_position,
         }
\ No newline at end of file
@@ -1,7 +1,11 @@
+import queue
+import threading
+
 import cv2
 import numpy as np
 import pygame
-from game import SnakeGame
+import config
+from game import PLAYING, GameState, SnakeGame
 from hand_tracker import HandTracker
 
 class SnakeGameApp:
@@ -19,6 +23,20 @@ class SnakeGameApp:
         self.running = True
         self.pause_gesture_cooldown = 0
 
+        # Run hand inference on every (SKIP_FRAMES + 1)th frame only
+        self._skip = config.PERF_CONFIG.SKIP_FRAMES
+        self._frame_i = 0
+
+        # Capture and hand inference run on a background thread; the game
+        # loop consumes only the most recent result and never waits on it
+        self._latest = queue.Queue(maxsize=1)
+        self._vision_thread = threading.Thread(target=self._vision_loop, daemon=True)
+
+        # Reused output buffers for the side-by-side view
+        self._combined = None
+        self._game_bgr = None
+        self._game_resized = None
+
     def run(self):
         """Main game loop"""
         print("Starting Snake Game...")
@@ -28,21 +46,17 @@ class SnakeGameApp:
         print("  - Press SPACE to start/restart")
         print("  - Press 'q' to quit")
 
+        self._vision_thread.start()
+        frame, is_detected, smoothed_pos = None, False, None
+
         try:
             while self.running:
-                ret, frame = self.cap.read()
-                if not ret:
-                    print("Error: Failed to read frame from webcam")
-                    break
-
-                frame = cv2.flip(frame, 1)
-
-                # Detect hand position
-                hand_pos, is_detected = self.hand_tracker.detect_hand(frame)
-                smoothed_pos = self.hand_tracker.get_smoothed_position()
-
-                # Detect pause gesture (closed fist)
-                is_fist = self.hand_tracker.detect_fist_gesture(frame)
+                # Take the newest vision result if one arrived since last frame
+                is_fist = False
+                try:
+                    frame, is_detected, smoothed_pos, is_fist = self._latest.get_nowait()
+                except queue.Empty:
+                    pass
 
                 # Handle pause gesture with cooldown
                 if is_fist and self.pause_gesture_cooldown <= 0:
@@ -60,23 +74,30 @@ class SnakeGameApp:
                 self.game.update()
                 self.game.draw()
 
-                # Draw hand tracking visualization
-                frame = self.hand_tracker.draw_hand_landmarks(frame)
+                if frame is None:
+                    # No webcam frame yet; keep the game loop ticking
+                    self._handle_keyboard_input()
+                    self.game.clock.tick(self.game.config.FPS)
+                    continue
+
+                # Annotate a copy so a frame reused on the next tick stays clean
+                frame_view = frame.copy()
 
                 if is_detected and smoothed_pos:
-                    cv2.circle(frame, smoothed_pos, 8, (0, 255, 0), -1)
-                    cv2.circle(frame, smoothed_pos, 10, (0, 255, 0), 2)
+                    cv2.circle(frame_view, smoothed_pos, 8, (0, 255, 0), -1)
+                    cv2.circle(frame_view, smoothed_pos, 10, (0, 255, 0), 2)
 
                 # Add status information
-                status = self.game.state.name
-                color = (0, 255, 0) if "PLAYING" in status else (0, 165, 255)
-                cv2.putText(frame, f"State: {status}", (10, 30),
+                state = self.game.state
+                status = state.name
+                color = (0, 255, 0) if state is PLAYING else (0, 165, 255)
+                cv2.putText(frame_view, f"State: {status}", (10, 30),
                             cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
-                cv2.putText(frame, f"Score: {self.game.score}", (10, 70),
+                cv2.putText(frame_view, f"Score: {self.game.score}", (10, 70),
                             cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
 
                 # Display combined view
-                self._display_combined_view(frame)
+                self._display_combined_view(frame_view)
 
                 # Handle keyboard input
                 self._handle_keyboard_input()
@@ -91,32 +112,110 @@ class SnakeGameApp:
         finally:
             self.cleanup()
 
-    def _display_combined_view(self, webcam_frame):
-        """Display webcam and game side by side"""
+    def _vision_loop(self):
+        """Capture webcam frames and run hand tracking until the app stops"""
+        is_detected, is_fist, results = False, False, None
+
+        # Pace capture and inference to the game's tick rate, so MediaPipe
+        # runs about once per game frame and SKIP_FRAMES and the smoothing
+        # window keep counting game ticks
+        clock = pygame.time.Clock()
+
         try:
-            # FIX: Safe Pygame to OpenCV conversion
-            game_surface = self.game.screen
-            game_array = pygame.surfarray.array3d(game_surface)
+            while self.running:
+                clock.tick(self.game.config.FPS)
+
+                ret, frame = self.cap.read()
+                if not ret:
+                    print("Error: Failed to read frame from webcam")
+                    self.running = False
+                    break
+
+                frame = cv2.flip(frame, 1)
 
-            # Rotate and flip to match OpenCV's coordinate system
-            game_array = np.rot90(game_array, 3)
-            game_array = np.fliplr(game_array)
-            game_frame = cv2.cvtColor(game_array, cv2.COLOR_RGB2BGR)
+                # On skipped frames the previous detection results are reused
+                if self._frame_i % (self._skip + 1) == 0:
+                    # Run hand inference once; the helpers below reuse its results
+                    results = self.hand_tracker.process(frame)
 
-            # Resize frames to match height
-            h_cam, w_cam = webcam_frame.shape[:2]
-            h_game, w_game = game_frame.shape[:2]
+                    # Detect hand position
+                    _, is_detected = self.hand_tracker.detect_hand(frame)
 
-            if h_cam != h_game:
-                game_frame = cv2.resize(game_frame, (int(w_game * (h_cam / h_game)), h_cam))
+                    # Detect pause gesture (closed fist)
+                    is_fist = self.hand_tracker.detect_fist_gesture(frame)
+                self._frame_i += 1
+
+                smoothed_pos = self.hand_tracker.get_smoothed_position()
+
+                # Draw hand tracking visualization
+                frame = self.hand_tracker.draw_hand_landmarks(frame, results)
+
+                self._publish((frame, is_detected, smoothed_pos, is_fist))
+
+        except Exception as e:
+            print(f"Vision error: {e}")
+            import traceback
+            traceback.print_exc()
+            self.running = False
+
+    def _publish(self, item):
+        """
+        Hand the newest vision result to the game loop, replacing an unread one
+
+        A fist seen in the replaced result is carried over so the pause
+        gesture is never lost.
+        """
+        try:
+            stale = self._latest.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            if stale[3] and not item[3]:
+                item = item[:3] + (True,)
+        self._latest.put_nowait(item)
+
+    def _display_combined_view(self, webcam_frame):
+        """Display webcam and game side by side"""
+        try:
+            h_cam, w_cam = webcam_frame.shape[:2]
+            w_game, h_game = self.game.screen.get_size()
+            self._ensure_view_buffers(h_cam, w_cam, h_game, w_game)
+            combined = self._combined
+
+            # pixels3d is a zero-copy (W, H, RGB) view of the game surface;
+            # swapping axes and reversing channels gives OpenCV's (H, W, BGR)
+            pixels = pygame.surfarray.pixels3d(self.game.screen)
+            game_view = pixels.swapaxes(0, 1)[:, :, ::-1]
+
+            combined[:, :w_cam] = webcam_frame
+            if h_game == h_cam:
+                combined[:, w_cam:] = game_view
+            else:
+                np.copyto(self._game_bgr, game_view)
+                cv2.resize(self._game_bgr, self._game_resized.shape[1::-1],
+                           dst=self._game_resized)
+                combined[:, w_cam:] = self._game_resized
+
+            # Release the surface lock before the next frame draws to it
+            del game_view, pixels
 
-            # Combine horizontally
-            combined = np.hstack([webcam_frame, game_frame])
             cv2.imshow("Snake Game - Hand Gesture Control", combined)
 
         except Exception as e:
             print(f"Display error: {e}")
 
+    def _ensure_view_buffers(self, h_cam, w_cam, h_game, w_game):
+        """Allocate the combined view buffers once for the current frame sizes"""
+        w_scaled = int(w_game * (h_cam / h_game))
+        shape = (h_cam, w_cam + w_scaled, 3)
+
+        if self._combined is not None and self._combined.shape == shape:
+            return
+
+        self._combined = np.empty(shape, dtype=np.uint8)
+        self._game_bgr = np.empty((h_game, w_game, 3), dtype=np.uint8)
+        self._game_resized = np.empty((h_cam, w_scaled, 3), dtype=np.uint8)
+
     def _handle_keyboard_input(self):
         """Handle keyboard input"""
         key = cv2.waitKey(1) & 0xFF
@@ -124,16 +223,18 @@ class SnakeGameApp:
         if key == ord('q'):
             self.running = False
         elif key == ord(' '):
-            # 0: MENU, 3: GAME_OVER (Check snake_game logic for exact values)
-            if self.game.state.value == 0:
+            if self.game.state is GameState.MENU:
                 self.game.start_game()
-            elif self.game.state.value == 3:
+            elif self.game.state is GameState.GAME_OVER:
                 self.game.reset_game()
                 self.game.start_game()
 
     def cleanup(self):
         """Clean up resources"""
         print("Cleaning up...")
+        self.running = False
+        if self._vision_thread.is_alive():
+            self._vision_thread.join(timeout=1.0)
         if self.cap.isOpened():
             self.cap.release()
         cv2.destroyAllWindows()